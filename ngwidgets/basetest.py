@@ -16,12 +16,19 @@ class Basetest(unittest.TestCase):
     base test case
     """
 
-    def setUp(self, debug=False, profile=True):
+    def setUp(self, debug=False, profile=None):
         """
         setUp test environment
+
+        Args:
+            debug(bool): if True show debug output
+            profile(bool): if True show timing messages - if None
+                profiling is enabled via NGW_PROFILE=1 in the environment
         """
         unittest.TestCase.setUp(self)
         self.debug = debug
+        if profile is None:
+            profile = Basetest.profile_enabled()
         self.profile = profile
         msg = f"test {self._testMethodName}, debug={self.debug}"
         self.profiler = Profiler(msg, profile=self.profile)
@@ -30,6 +37,13 @@ class Basetest(unittest.TestCase):
         unittest.TestCase.tearDown(self)
         self.profiler.time()
 
+    @staticmethod
+    def profile_enabled() -> bool:
+        """
+        is profiling enabled via the NGW_PROFILE environment variable?
+        """
+        return os.environ.get("NGW_PROFILE") == "1"
+
     @staticmethod
     def inPublicCI():
         """
@@ -75,18 +75,55 @@ class GitHubAccess:
         Initialize the GitHub instance.
 
         If an access_token is provided, use it for authenticated access to increase the rate limit.
-        Otherwise, attempt to read the access token from a YAML file in the default directory.
+        Otherwise, attempt to read the access token from a YAML file in the default directory
+        or from the GITHUB_TOKEN environment variable.
         If no token is found, access is unauthenticated with lower rate limits.
 
         Args:
             default_directory (str): Path to the directory where the access token file is stored.
             access_token (Optional[str]): A GitHub personal access token. Defaults to None.
         """
-        if not access_token and default_directory:
-            access_token = self._read_access_token(default_directory)
+        if not access_token:
+            access_token = GitHubAccess.get_access_token(default_directory)
         self.github = Github(access_token)
 
-    def _read_access_token(self, default_directory: str) -> Optional[str]:
+    @staticmethod
+    def get_access_token(default_directory: str = None) -> Optional[str]:
+        """
+        Get the GitHub access token from the YAML file in the default directory
+        or from the GITHUB_TOKEN environment variable. Empty tokens e.g. from an
+        unset GitHub Actions secret are ignored.
+
+        Args:
+            default_directory (str): Path to the directory where the access token file is stored.
+
+        Returns:
+            Optional[str]: The access token if found, otherwise None.
+        """
+        access_token = None
+        if default_directory:
+            access_token = GitHubAccess._read_access_token(default_directory)
+        if not access_token:
+            access_token = os.environ.get("GITHUB_TOKEN")
+        if not access_token:
+            access_token = None
+        return access_token
+
+    @staticmethod
+    def has_access_token(default_directory: str = None) -> bool:
+        """
+        Check whether authenticated GitHub access is available.
+
+        Args:
+            default_directory (str): Path to the directory where the access token file is stored.
+
+        Returns:
+            bool: True if an access token was found in the file or the environment.
+        """
+        return bool(GitHubAccess.get_access_token(default_directory))
+
+    @staticmethod
+    def _read_access_token(default_directory: str) -> Optional[str]:
         """
         Read the GitHub access token from a YAML file located in the default directory.
 
@@ -219,7 +256,8 @@ class Project:
         """
         method to lazy-loaded components. Loads components from URL if components_url is set.
         If a cache directory is provided, it caches the YAML file in that directory. The cache validity period
-        can be specified in seconds.
+        can be specified in seconds. An outdated cache file is refreshed with a conditional ETag based
+        request so that unchanged components are not downloaded again.
 
         Args:
             cache_directory (str, optional): Directory for caching the YAML files. If None, caching is disabled.
@@ -250,7 +288,9 @@ class Project:
                     components = Components.load_from_yaml_file(str(file_path))
 
         if load_from_url:
-            components = Components.load_from_yaml_url(self.components_url)
+            components = Components.load_from_yaml_url(
+                self.components_url, cache_directory=cache_directory
+            )
             if cache_directory:
                 components.save_to_yaml_file(str(file_path))
 
@@ -5,6 +5,7 @@ Created on 2023-11-03
 """
 
 import json
+import os
 import sys
 import threading
 import time
@@ -103,61 +104,133 @@ class WebserverTest(Basetest):
         ws: An instance of the web server being tested.
         ws_thread: The thread running the web server.
         client: A test client for interacting with the web server.
+        server_class: set in a subclass together with cmd_class to share
+            one web server for all tests of the class
+        cmd_class: the command class to use for the shared web server
+        server_debug: if True show debug messages of the shared web server runner
+        shared_server: True if the class shares one web server for all its tests
+        own_server: True if the test started its own web server in setUp
     """
 
-    def setUp(self, server_class, cmd_class, debug=False, profile=True):
+    server_class = None
+    cmd_class = None
+    server_debug = False
+    shared_server = False
+    own_server = False
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        start a web server shared by all tests of the class
+        if server_class and cmd_class are set
+        """
+        super().setUpClass()
+        cls.shared_server = cls.server_class is not None and cls.cmd_class is not None
+        if cls.shared_server:
+            WebserverTest.start_server(
+                cls, cls.server_class, cls.cmd_class, debug=cls.server_debug
+            )
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        stop the shared web server
+        """
+        if cls.shared_server:
+            cls.server_runner.stop()
+        super().tearDownClass()
+
+    @staticmethod
+    def start_server(target, server_class, cmd_class, debug: bool = False):
         """
         Create and start a test instance of a web server using the specified server and command classes.
 
         Args:
+            target: the test class or test instance to set the config, cmd, ws, server_runner and client attributes for
             server_class: The class of the server to be tested. This should be a class reference that
                           includes a static `get_config()` method and an instance method `run()`.
             cmd_class: The command class used to parse command-line arguments for the server.
                        This class should have an initialization accepting `config` and `server_class`
                        and a method `cmd_parse()` that accepts a list of arguments.
-
-        Returns:
-            An instance of WebserverTest containing the started server thread and test client.
-
-        Raises:
-            ValueError: If an invalid server_class or cmd_class is provided.
-
-        Example:
-            >>> test_server = WebserverTest.get_webserver_test(MyServerClass, MyCommandClass)
-            >>> test_server.client.get('/')
-            <Response [200]>
+            debug: if True show debug messages of the server runner
         """
-        Basetest.setUp(self, debug=debug, profile=profile)
-        self.config = (
+        target.config = (
             server_class.get_config()
         )  # Assumes `get_config()` is a class method of server_class
-        self.config.default_port += (
+        target.config.default_port += (
             10000  # Use a different port for testing than for production
         )
+        # use a different port per pytest-xdist worker
+        target.config.default_port += WebserverTest.get_worker_port_offset()
 
-        self.cmd = cmd_class(
-            self.config, server_class
+        target.cmd = cmd_class(
+            target.config, server_class
         )  # Instantiate the command class with config and server_class
         argv = []
-        args = self.cmd.cmd_parse(
+        args = target.cmd.cmd_parse(
             argv
         )  # Parse the command-line arguments with no arguments passed
 
-        self.ws = server_class()  # Instantiate the server class
-        self.server_runner = ThreadedServerRunner(self.ws, args=args, debug=self.debug)
-        self.server_runner.start()  # start server in separate thread
+        target.ws = server_class()  # Instantiate the server class
+        target.server_runner = ThreadedServerRunner(target.ws, args=args, debug=debug)
+        target.server_runner.start()  # start server in separate thread
 
-        self.client = TestClient(
-            self.ws.app
+        target.client = TestClient(
+            target.ws.app
         )  # Instantiate the test client with the server's app
 
+    @staticmethod
+    def get_worker_port_offset() -> int:
+        """
+        get the port offset for the pytest-xdist worker we are running in
+        so that parallel workers do not compete for the same port
+
+        Returns:
+            int: the worker number e.g. 3 for worker gw3 or 0 if not running with pytest-xdist
+        """
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        offset = int(worker.removeprefix("gw"))
+        return offset
+
+    def setUp(self, server_class=None, cmd_class=None, debug=False, profile=None):
+        """
+        Create and start a test instance of a web server using the specified server and command classes.
+        If no server and command classes are given the shared web server of the class is used.
+
+        Args:
+            server_class: The class of the server to be tested. This should be a class reference that
+                          includes a static `get_config()` method and an instance method `run()`.
+            cmd_class: The command class used to parse command-line arguments for the server.
+                       This class should have an initialization accepting `config` and `server_class`
+                       and a method `cmd_parse()` that accepts a list of arguments.
+            debug: if True show debug messages
+            profile: if True profile the test
+
+        Raises:
+            ValueError: If no web server is available or if server and command classes are given
+                        although the class already shares a web server on the same port.
+        """
+        Basetest.setUp(self, debug=debug, profile=profile)
+        self.own_server = server_class is not None and cmd_class is not None
+        if self.own_server and self.shared_server:
+            raise ValueError(
+                f"{type(self).__name__} already shares a web server - do not pass server_class and cmd_class to setUp"
+            )
+        if not self.own_server and not self.shared_server:
+            raise ValueError(
+                f"{type(self).__name__} has no web server - set the server_class and cmd_class class attributes or pass them to setUp"
+            )
+        if self.own_server:
+            WebserverTest.start_server(self, server_class, cmd_class, debug=self.debug)
+
     def tearDown(self):
         """
         tear Down everything
         """
         super().tearDown()
-        # Stop the server using the ThreadedServerRunner
-        self.server_runner.stop()
+        # Stop the server of this test using the ThreadedServerRunner
+        if self.own_server:
+            self.server_runner.stop()
 
     def get_response(self, path: str, expected_status_code: int = 200) -> Response:
         """
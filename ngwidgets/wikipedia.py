@@ -7,6 +7,7 @@ Created on 2024-06-22
 @author: wf
 """
 
+import orjson
 import requests
 
 
@@ -58,7 +59,9 @@ class WikipediaSearch:
             "srlimit": limit,  # Limit the number of search results
         }
         response = self.session.get(self.base_url, params=params)
-        search_results = response.json().get("query", {}).get("search", [])
+        search_results = (
+            orjson.loads(response.content).get("query", {}).get("search", [])
+        )
 
         # Formulate results including summaries and URLs
         detailed_results = []
@@ -73,7 +76,9 @@ class WikipediaSearch:
                 "format": "json",
             }
             page_response = self.session.get(self.base_url, params=page_params)
-            page_info = page_response.json()["query"]["pages"][str(page_id)]
+            page_info = orjson.loads(page_response.content)["query"]["pages"][
+                str(page_id)
+            ]
             url = page_info["fullurl"]  # Direct URL from the API
 
             detailed_result = {
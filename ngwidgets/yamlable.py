@@ -35,16 +35,27 @@ Prompts for the development and extension of the 'YamlAble' class within the 'ya
     
 """
 
+import hashlib
+import urllib.error
 import urllib.request
 from collections.abc import Iterable, Mapping
 from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime
-from typing import Any, Generic, Type, TypeVar
+from pathlib import Path
+from typing import Any, Generic, Optional, Type, TypeVar
 
 import yaml
 from dacite import from_dict
 from dataclasses_json import dataclass_json
 
+# use the LibYAML C bindings if available
+try:
+    from yaml import CDumper as Dumper
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import Dumper, SafeDumper, SafeLoader
+
 T = TypeVar("T")
 
 
@@ -84,6 +95,26 @@ class DateConvert:
         return date
 
 
+class YamlAbleDumper(SafeDumper):
+    """
+    the YAML dumper for YamlAble - a subclass so that the custom
+    representers do not modify the global yaml dumper classes
+    """
+
+    def ignore_aliases(self, _data) -> bool:
+        return True
+
+
+class YamlAbleFallbackDumper(Dumper):
+    """
+    the YAML dumper for YamlAble instances with values that the safe dumper
+    can not represent e.g. Path or Enum values
+    """
+
+    def ignore_aliases(self, _data) -> bool:
+        return True
+
+
 class YamlAble(Generic[T]):
     """
     An extended YAML handler class for converting dataclass objects to and from YAML format,
@@ -97,16 +128,17 @@ class YamlAble(Generic[T]):
         if not is_dataclass(self):
             raise ValueError("I must be a dataclass instance.")
         if not hasattr(self, "_yaml_dumper"):
-            self._yaml_dumper = yaml.Dumper
-            self._yaml_dumper.ignore_aliases = lambda *_args: True
-            self._yaml_dumper.add_representer(type(None), self.represent_none)
-            self._yaml_dumper.add_representer(str, self.represent_literal)
+            self._yaml_dumper = YamlAbleDumper
+            self._yaml_fallback_dumper = YamlAbleFallbackDumper
+            for dumper in self._yaml_dumper, self._yaml_fallback_dumper:
+                dumper.add_representer(type(None), self.represent_none)
+                dumper.add_representer(str, self.represent_literal)
 
-    def represent_none(self, _, __) -> yaml.Node:
+    def represent_none(self, dumper: yaml.Dumper, _) -> yaml.Node:
         """
         Custom representer for ignoring None values in the YAML output.
         """
-        return self._yaml_dumper.represent_scalar("tag:yaml.org,2002:null", "")
+        return dumper.represent_scalar("tag:yaml.org,2002:null", "")
 
     def represent_literal(self, dumper: yaml.Dumper, data: str) -> yaml.Node:
         """
@@ -126,6 +158,8 @@ class YamlAble(Generic[T]):
         """
         Converts this dataclass object to a YAML string, with options to omit None values and/or underscore-prefixed variables,
         and using block scalar style for strings.
+        Values that the safe dumper can not represent e.g. Path or Enum values
+        are dumped with python specific tags by the fallback dumper.
 
         Args:
             ignore_none: Flag to indicate whether None values should be removed from the YAML output.
@@ -141,13 +175,17 @@ class YamlAble(Generic[T]):
         clean_dict = self.remove_ignored_values(
             obj_dict, ignore_none, ignore_underscore
         )
-        yaml_str = yaml.dump(
-            clean_dict,
-            Dumper=self._yaml_dumper,
-            default_flow_style=False,
-            allow_unicode=allow_unicode,
-            sort_keys=sort_keys,
-        )
+        dump_options = {
+            "default_flow_style": False,
+            "allow_unicode": allow_unicode,
+            "sort_keys": sort_keys,
+        }
+        try:
+            yaml_str = yaml.dump(clean_dict, Dumper=self._yaml_dumper, **dump_options)
+        except yaml.representer.RepresenterError:
+            yaml_str = yaml.dump(
+                clean_dict, Dumper=self._yaml_fallback_dumper, **dump_options
+            )
         return yaml_str
 
     @classmethod
@@ -161,7 +199,7 @@ class YamlAble(Generic[T]):
         Returns:
             T: An instance of the dataclass.
         """
-        data: dict[str, Any] = yaml.safe_load(yaml_str)
+        data: dict[str, Any] = yaml.load(yaml_str, Loader=SafeLoader)
         instance: T = cls.from_dict(data)
         return instance
 
@@ -182,17 +220,20 @@ class YamlAble(Generic[T]):
         return instance
 
     @classmethod
-    def load_from_yaml_url(cls: Type[T], url: str) -> T:
+    def load_from_yaml_url(
+        cls: Type[T], url: str, cache_directory: Optional[str] = None
+    ) -> T:
         """
         Loads a dataclass instance from a YAML string obtained from a URL.
 
         Args:
             url (str): The URL pointing to the YAML data.
+            cache_directory (str, optional): Directory for an ETag based cache of the content. If None, caching is disabled.
 
         Returns:
             T: An instance of the dataclass.
         """
-        yaml_str: str = cls.read_from_url(url)
+        yaml_str: str = cls.read_from_url(url, cache_directory=cache_directory)
         instance: T = cls.from_yaml(yaml_str)
         return instance
 
@@ -251,16 +292,64 @@ class YamlAble(Generic[T]):
             file.write(json_content)
 
     @classmethod
-    def read_from_url(cls, url: str) -> str:
+    def read_from_url(cls, url: str, cache_directory: Optional[str] = None) -> str:
         """
         Helper method to fetch content from a URL.
+
+        Args:
+            url (str): The URL to fetch the content from.
+            cache_directory (str, optional): Directory for an ETag based cache of the content. If None, caching is disabled.
         """
+        if cache_directory:
+            return cls.read_from_url_cached(url, cache_directory)
         with urllib.request.urlopen(url) as response:
             if response.status == 200:
                 return response.read().decode()
             else:
                 raise Exception(f"Unable to load data from URL: {url}")
 
+    @classmethod
+    def read_from_url_cached(cls, url: str, cache_directory: str) -> str:
+        """
+        Fetch content from a URL using a conditional If-None-Match request
+        so that the content is only downloaded if it changed since the last call.
+
+        Args:
+            url (str): The URL to fetch the content from.
+            cache_directory (str): Directory where the content and its ETag are cached.
+
+        Returns:
+            str: The (possibly cached) content.
+        """
+        cache_path = Path(cache_directory)
+        cache_path.mkdir(parents=True, exist_ok=True)
+        url_hash = hashlib.sha256(url.encode()).hexdigest()
+        content_path = cache_path / f"{url_hash}.cache"
+        etag_path = cache_path / f"{url_hash}.etag"
+        headers = {}
+        if content_path.exists() and etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text()
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request) as response:
+                if response.status != 200:
+                    raise Exception(f"Unable to load data from URL: {url}")
+                content = response.read().decode()
+                etag = response.headers.get("ETag")
+        except urllib.error.HTTPError as ex:
+            # 304 Not Modified - the cached content is still valid
+            if ex.code != 304:
+                raise
+            return content_path.read_text(encoding="utf-8")
+        if etag:
+            content_path.write_text(content, encoding="utf-8")
+            etag_path.write_text(etag)
+        else:
+            # without an ETag the content can not be revalidated
+            content_path.unlink(missing_ok=True)
+            etag_path.unlink(missing_ok=True)
+        return content
+
     @classmethod
     def remove_ignored_values(
         cls,
@@ -18,3 +18,14 @@ def chrome_options():
     options = webdriver.ChromeOptions()
     options.add_argument("headless")
     return options
+
+
+def pytest_collection_modifyitems(items):
+    """
+    keep the screen tests on one pytest-xdist worker when running with
+    pytest -n auto --dist loadgroup since the nicegui test server of the
+    screen fixture binds a fixed port
+    """
+    for item in items:
+        if "screen" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.xdist_group("nicegui_screen"))
@@ -0,0 +1,131 @@
+"""
+pytest configuration for the tests
+
+Created on 2026-10-16
+
+@author: wf
+"""
+
+import time
+from dataclasses import fields
+from datetime import datetime
+from typing import Optional, Tuple
+
+import pytest
+
+# import the heavy modules once at collection time so that the
+# NiceGUI/FastAPI import cost is not attributed to the first test
+import ngwidgets.webserver_test
+import ngwidgets.widgets_demo
+import ngwidgets.wikipedia
+import ngwidgets.yamlable
+from ngwidgets.projects import GitHubAccess, Project
+from ngwidgets.webserver_test import WebserverTest
+
+
+class ProjectSnapshotCache:
+    """
+    cache json snapshots of the projects for GitHub repositories
+    including their component count in the pytest cache
+    """
+
+    # increase when the snapshot record format changes
+    version = 1
+
+    def __init__(self, cache, ttl_secs: int = 86400):
+        """
+        constructor
+
+        Args:
+            cache: the pytest cache to use
+            ttl_secs(int): the number of seconds a snapshot is valid - default: one day
+        """
+        self.cache = cache
+        self.ttl_secs = ttl_secs
+
+    def key(self, repo_name: str) -> str:
+        """
+        get the pytest cache key for the given repository name
+        """
+        key = f"ngwidgets/project_snapshot/v{self.version}/{repo_name}"
+        return key
+
+    def get_record(self, repo_name: str) -> Optional[dict]:
+        """
+        get the snapshot record for the given repository name
+
+        Returns:
+            dict: the record or None if there is no valid snapshot
+        """
+        record = self.cache.get(self.key(repo_name), None)
+        if record and time.time() - record["timestamp"] > self.ttl_secs:
+            record = None
+        return record
+
+    def is_cached(self, repo_name: str) -> bool:
+        """
+        check whether there is a valid snapshot for the given repository name
+        """
+        return self.get_record(repo_name) is not None
+
+    def get(
+        self, repo_name: str, github_access: GitHubAccess, cache_directory: str = None
+    ) -> Tuple[Project, int]:
+        """
+        get the project and its component count for the given repository name
+        from the cache - only a cache miss leads to GitHub API and raw content
+        requests whose results are then stored for subsequent runs
+
+        Args:
+            repo_name(str): the full name of the repository e.g. WolfgangFahl/nicegui_widgets
+            github_access(GitHubAccess): the GitHub access to use on a cache miss
+            cache_directory(str): the components cache directory to use on a cache miss
+
+        Returns:
+            Tuple[Project, int]: the project and its component count
+        """
+        record = self.get_record(repo_name)
+        if record is None:
+            repo = github_access.github.get_repo(repo_name)
+            project = Project.from_github(repo)
+            component_count = 0
+            if project.components_url:
+                components = project.get_components(cache_directory=cache_directory)
+                component_count = len(components.components) if components else 0
+            project_record = {
+                field.name: getattr(project, field.name) for field in fields(project)
+            }
+            if project.created_at:
+                project_record["created_at"] = project.created_at.isoformat()
+            record = {
+                "timestamp": time.time(),
+                "project": project_record,
+                "component_count": component_count,
+            }
+            self.cache.set(self.key(repo_name), record)
+        project_record = dict(record["project"])
+        created_at = project_record["created_at"]
+        if created_at:
+            project_record["created_at"] = datetime.fromisoformat(created_at)
+        project = Project(**project_record)
+        return project, record["component_count"]
+
+
+def pytest_collection_modifyitems(items):
+    """
+    keep the web server tests on one pytest-xdist worker when running with
+    pytest -n auto --dist loadgroup so that the shared web server and its
+    ~/.solutions configuration are only set up once
+    """
+    for item in items:
+        cls = getattr(item, "cls", None)
+        if cls and issubclass(cls, WebserverTest):
+            item.add_marker(pytest.mark.xdist_group("webserver"))
+
+
+@pytest.fixture
+def cached_project(pytestconfig) -> ProjectSnapshotCache:
+    """
+    get the project snapshots of GitHub repositories via the pytest cache
+    """
+    return ProjectSnapshotCache(pytestconfig.cache)
@@ -13,7 +13,7 @@ class TestGPXViewer(Basetest):
     test GPXViewer
     """
 
-    def setUp(self, debug=True, profile=True):
+    def setUp(self, debug=True, profile=None):
         Basetest.setUp(self, debug=debug, profile=profile)
 
     def test_gpx_viewer(self):
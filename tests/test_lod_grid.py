@@ -13,7 +13,7 @@ class TestLodGrid(Basetest):
     test ListOfDictsGrid
     """
 
-    def setUp(self, debug=False, profile=True):
+    def setUp(self, debug=False, profile=None):
         Basetest.setUp(self, debug=debug, profile=profile)
         self.lod = [
             {"name": "Alice", "age": 18, "parent": "David"},
@@ -7,10 +7,15 @@ Test suite for the nicegui_projects module in the ngwidgets package.
 """
 
 import json
-from dataclasses import asdict
+import logging
+import sys
+import tempfile
+import unittest
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+import pytest
 from dateutil.parser import parse
 
 from ngwidgets.basetest import Basetest
@@ -18,14 +23,45 @@ from ngwidgets.components import Components
 from ngwidgets.progress import TqdmProgressbar
 from ngwidgets.projects import GitHubAccess, Project, Projects, PyPi
 
+logger = logging.getLogger(__name__)
+
+# the directory of the github_access_token.yaml file
+TOKEN_DIRECTORY = Projects(topic="nicegui").default_directory
+HAS_GITHUB_TOKEN = GitHubAccess.has_access_token(TOKEN_DIRECTORY)
+
+
+class LazyJson:
+    """
+    defer the json serialization of a record until
+    it is actually needed e.g. by an enabled log handler
+    """
+
+    def __init__(self, record):
+        self.record = record
+
+    def __str__(self) -> str:
+        """
+        get an indented json representation of my record
+        with datetime values serialized natively by orjson
+        """
+        json_str = orjson.dumps(self.record, option=orjson.OPT_INDENT_2).decode()
+        return json_str
+
 
 class TestNiceguiProjects(Basetest):
     """
     Test cases for the nicegui_projects module.
     """
 
-    def setUp(self, debug=True, profile=True):
+    def setUp(self, debug=True, profile=None):
         Basetest.setUp(self, debug=debug, profile=profile)
+        if self.debug:
+            # show the lazily formatted debug log output like the debug prints
+            handler = logging.StreamHandler(sys.stdout)
+            self.addCleanup(logger.setLevel, logger.level)
+            self.addCleanup(logger.removeHandler, handler)
+            logger.addHandler(handler)
+            logger.setLevel(logging.DEBUG)
         self.pypi_test_projects = [
             (
                 "dynamic-competence-map",
@@ -36,6 +72,13 @@ class TestNiceguiProjects(Basetest):
             ("nicegui-extensions", "https://pypi.org/project/nicegui-extensions/"),
         ]
 
+    @pytest.fixture(autouse=True)
+    def inject_cached_project(self, cached_project):
+        """
+        make the cached_project fixture available when running under pytest
+        """
+        self.cached_project = cached_project
+
     def test_get_package_info(self):
         """
         Test getting detailed information about a package from PyPI.
@@ -50,7 +93,7 @@ class TestNiceguiProjects(Basetest):
                 print(json.dumps(package_info["info"], indent=2))
 
                 print("Project Data:")
-                print(json.dumps(asdict(project), indent=2, default=str))
+                print(orjson.dumps(vars(project), option=orjson.OPT_INDENT_2).decode())
             self.assertIsNotNone(package_info)
             self.assertIn("info", package_info)
             self.assertIn("summary", package_info["info"])
@@ -62,9 +105,8 @@ class TestNiceguiProjects(Basetest):
         """
         pypi = PyPi()
         search_result = pypi.search_packages("nicegui")
-        if self.debug:
-            for package_record in search_result:
-                print(json.dumps(package_record["info"], indent=2))
+        for package_record in search_result:
+            logger.debug("%s", LazyJson(package_record["info"]))
         self.assertIsNotNone(search_result)
         self.assertTrue(len(search_result) > 0)
 
@@ -74,17 +116,17 @@ class TestNiceguiProjects(Basetest):
         """
         pypi = PyPi()
         search_result = pypi.search_projects("nicegui")
-        if self.debug:
-            for project in search_result:
-                print(json.dumps(asdict(project), indent=2, default=str))
+        for project in search_result:
+            logger.debug("%s", LazyJson(vars(project)))
         self.assertIsNotNone(search_result)
         self.assertTrue(len(search_result) > 0)
 
+    @unittest.skipUnless(HAS_GITHUB_TOKEN, "no GitHub token")
     def test_search_repositories_by_topic(self):
         """
         Test searching for repositories by a specific topic.
         """
-        github_access = GitHubAccess()
+        github_access = GitHubAccess(TOKEN_DIRECTORY)
         query = "topic:nicegui"
         repositories = github_access.search_repositories(query)
         self.assertIsNotNone(repositories)
@@ -103,9 +145,11 @@ class TestNiceguiProjects(Basetest):
         """
         Test creating a Project instance from a GitHub repository.
         """
-        github_access = (
-            GitHubAccess()
-        )  # Assuming GitHubAccess is already defined and properly set up
+        github_access = GitHubAccess(TOKEN_DIRECTORY)
+        # use the pytest cache snapshots of the projects if available
+        cached_project = getattr(self, "cached_project", None)
+        if self.inPublicCI():
+            cached_project = None
         projects = Projects(topic="nicegui")
         # List of tuples with repository names and expected attributes
         example_repos = [
@@ -150,24 +194,45 @@ class TestNiceguiProjects(Basetest):
             ),
             # Add more test cases here as needed
         ]
+        # without a token only fully cached snapshots avoid the GitHub rate limit
+        all_cached = cached_project and all(
+            cached_project.is_cached(repo_name) for repo_name, _ in example_repos
+        )
+        if not HAS_GITHUB_TOKEN and not all_cached:
+            self.skipTest("no GitHub token and no cached project snapshots")
         for repo_name, expected_attributes in example_repos:
             url = expected_attributes["github"]
             ex_repo_name = projects.extract_repo_name_from_url(url)
             self.assertEqual(repo_name, ex_repo_name)
-            repo = github_access.github.get_repo(repo_name)
-
-            # Create a Project from the GitHub repository
-            project = Project.from_github(repo)
+            if cached_project:
+                project, component_count = cached_project.get(
+                    repo_name, github_access, cache_directory=projects.default_directory
+                )
+            else:
+                # Create a Project from the GitHub repository
+                repo = github_access.github.get_repo(repo_name)
+                project = Project.from_github(repo)
+                component_count = 0
+                if project.components_url:
+                    components = project.get_components(
+                        cache_directory=projects.default_directory
+                    )
+                    component_count = len(components.components)
 
             # Debug printout
             if self.debug:
-                print(
-                    f"Project for GitHub {repo_name}:\n{json.dumps(asdict(project), indent=2,default=str)}"
-                )
+                project_json = orjson.dumps(
+                    vars(project), option=orjson.OPT_INDENT_2
+                ).decode()
+                print(f"Project for GitHub {repo_name}:\n{project_json}")
+                print(f"found {component_count} components for {project.name}")
 
             # Assert that the Project has been properly created with expected attributes
             for attribute, expected_value in expected_attributes.items():
-                actual_value = getattr(project, attribute)
+                if attribute == "component_count":
+                    actual_value = component_count
+                else:
+                    actual_value = getattr(project, attribute)
                 if isinstance(actual_value, datetime):
                     # Parse the expected date string into a datetime object for comparison
                     expected_date = parse(expected_value)
@@ -177,15 +242,7 @@ class TestNiceguiProjects(Basetest):
                 else:
                     self.assertEqual(actual_value, expected_value)
 
-            if project.components_url:
-                components = project.get_components(
-                    cache_directory=projects.default_directory
-                )
-                if self.debug:
-                    print(
-                        f"found {len(components.components)} components for {project.name}"
-                    )
-
+    @unittest.skipUnless(HAS_GITHUB_TOKEN, "no GitHub token")
     def test_update_save_and_load_projects(self):
         """
         Test updating, saving, and loading projects for a specific topic using the Projects class.
@@ -235,8 +292,11 @@ class TestNiceguiProjects(Basetest):
                 "https://raw.githubusercontent.com/justpy-org/justpy/master/.components.yaml",
             )
         ]
+        cache_directory = Path(tempfile.gettempdir()) / "ngw_yaml_cache"
         for expected, url in cases:
-            components = Components.load_from_yaml_url(url)
+            components = Components.load_from_yaml_url(
+                url, cache_directory=cache_directory
+            )
             if self.debug:
                 for index, component in enumerate(components.components):
                     print(f"{index}:{component.to_yaml()}")
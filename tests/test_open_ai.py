@@ -17,7 +17,7 @@ class TestOpenAi(Basetest):
     test https://github.com/openai/openai-python library
     """
 
-    def setUp(self, debug=True, profile=True):
+    def setUp(self, debug=True, profile=None):
         Basetest.setUp(self, debug=debug, profile=profile)
         self.llm = LLM()
 
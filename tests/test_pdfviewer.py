@@ -4,7 +4,11 @@ Created on 2023-09-18
 @author: wf
 """
 
-from urllib import request
+import asyncio
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from ngwidgets.basetest import Basetest
 from ngwidgets.pdfviewer import pdfjs_urls
@@ -15,11 +19,54 @@ class TestPdfViewer(Basetest):
     test PdfViewer
     """
 
-    def setUp(self, debug=True, profile=True):
+    @classmethod
+    def setUpClass(cls):
+        """
+        create the connection pool shared by the per thread sessions
+        so that the checks reuse keep-alive connections per cdn host
+        """
+        super().setUpClass()
+        cls.adapter = HTTPAdapter(pool_maxsize=16)
+        cls.thread_local = threading.local()
+        cls.sessions = []
+        cls.sessions_lock = threading.Lock()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        close the sessions and the shared connection pool
+        """
+        for session in cls.sessions:
+            session.close()
+        cls.adapter.close()
+        super().tearDownClass()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        get the session of the current thread - requests.Session is not
+        documented to be thread-safe so each thread gets its own session
+        using the shared pooled adapter
+        """
+        session = getattr(cls.thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", cls.adapter)
+            cls.thread_local.session = session
+            with cls.sessions_lock:
+                cls.sessions.append(session)
+        return session
+
+    def setUp(self, debug=True, profile=None):
         Basetest.setUp(self, debug=debug, profile=profile)
 
     def check_content_type(
-        self, index, url: str, expected_type: str, timeout: float = 3.2
+        self,
+        index,
+        url: str,
+        expected_type: str,
+        timeout: float = 3.2,
+        chunk_size: int = 1024,
     ) -> bool:
         """
         check the content type
@@ -27,15 +74,22 @@ class TestPdfViewer(Basetest):
         result = False
         debug = self.debug
         status_code = 0
-        checks = {"css": ["{"], "js": ["function", "/* Copyright"]}
+        checks = {"css": [b"{"], "js": [b"function", b"/* Copyright"]}
         try:
-            with request.urlopen(url, timeout=timeout) as response:
-                status_code = response.getcode()
+            session = self.get_session()
+            with session.get(url, timeout=timeout, stream=True) as response:
+                status_code = response.status_code
                 if status_code == 200:
-                    text = response.read().decode("utf-8")
-                    for check in checks[expected_type]:
-                        if check in text:
+                    tokens = checks[expected_type]
+                    overlap = max(len(token) for token in tokens) - 1
+                    buffer = bytearray()
+                    # stream the content and stop at the first match
+                    for chunk in response.iter_content(chunk_size):
+                        # keep the tail of the previous chunk for matches across chunk borders
+                        buffer = buffer[max(0, len(buffer) - overlap) :] + chunk
+                        if any(token in buffer for token in tokens):
                             result = True
+                            break
             symbol = "✔" if result else "❌"
         except Exception as _ex:
             symbol = "⚠️"
@@ -43,15 +97,45 @@ class TestPdfViewer(Basetest):
             print(f"{index:3}:{expected_type:3}:{symbol}:{status_code}-{url}")
         return result
 
-    def check_cdn(self, index, cdn, version, debug):
+    async def check_cdn(self, index, urls: pdfjs_urls):
         """
-        check the content delivery network
+        check the content delivery network by checking
+        the css, library and viewer urls concurrently
         """
-        urls = pdfjs_urls(cdn, version, debug)
-        urls.configure()
-        self.assertTrue(self.check_content_type(index, urls.url["css"], "css"))
-        self.assertTrue(self.check_content_type(index, urls.url["js_lib"], "js"))
-        self.assertTrue(self.check_content_type(index, urls.url["js_viewer"], "js"))
+        checks = [
+            (urls.url["css"], "css"),
+            (urls.url["js_lib"], "js"),
+            (urls.url["js_viewer"], "js"),
+        ]
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(self.check_content_type, index, url, expected_type)
+                for url, expected_type in checks
+            )
+        )
+        for (url, _expected_type), result in zip(checks, results):
+            self.assertTrue(result, url)
+
+    async def check_cdns(self, cdns, versions):
+        """
+        check the given content delivery networks for the given versions
+        """
+        index = 0
+        checked = set()
+        for version in versions:
+            for cdn in cdns:
+                for debug in [False, True]:
+                    urls = pdfjs_urls(cdn, version, debug)
+                    urls.configure()
+                    # e.g. github has no minimized and no versioned urls
+                    # so only check urls that have not been checked yet
+                    url_key = tuple(urls.url.values())
+                    if url_key in checked:
+                        continue
+                    checked.add(url_key)
+                    with self.subTest(version=version, cdn=cdn, debug=debug):
+                        index += 1
+                        await self.check_cdn(index, urls)
 
     # @unittest.skipIf(Basetest.inPublicCI(), "unreliable in public CI")
     def test_cdns(self):
@@ -62,12 +146,7 @@ class TestPdfViewer(Basetest):
         if not super().inPublicCI():
             cdns.append("cdnjs")
             # cdns.append("unpkg")
-        index = 0
-        for version in ["3.9.179", "3.11.174"]:
-            # unpkg is not tested due to unreliability see
-            # https://github.com/mjackson/unpkg/issues/330
-            for cdn in cdns:
-                for debug in [False, True]:
-                    with self.subTest(version=version, cdn=cdn, debug=debug):
-                        index += 1
-                        self.check_cdn(index, cdn, version, debug)
+        # unpkg is not tested due to unreliability see
+        # https://github.com/mjackson/unpkg/issues/330
+        versions = ["3.9.179", "3.11.174"]
+        asyncio.run(self.check_cdns(cdns, versions))
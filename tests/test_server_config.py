@@ -10,6 +10,7 @@ import yaml
 
 from ngwidgets.basetest import Basetest
 from ngwidgets.webserver import WebserverConfig  # Import the correct class
+from ngwidgets.yamlable import SafeDumper
 
 
 class TestWebserverConfig(Basetest):
@@ -17,7 +18,7 @@ class TestWebserverConfig(Basetest):
     Test cases for the WebserverConfig class.
     """
 
-    def setUp(self, debug=True, profile=True):
+    def setUp(self, debug=True, profile=None):
         Basetest.setUp(self, debug=debug, profile=profile)
 
     def test_webserver_config(self):
@@ -37,7 +38,7 @@ class TestWebserverConfig(Basetest):
             "config_path": config_path,
         }
         with open(yaml_path, "w") as yaml_file:
-            yaml.dump(config_data, yaml_file)
+            yaml.dump(config_data, yaml_file, Dumper=SafeDumper)
         # Create a config object with the temporary file's directory and basename
         config = WebserverConfig(
             short_name=short_name,
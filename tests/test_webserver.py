@@ -15,10 +15,12 @@ class TestDemoWebserver(WebserverTest):
     test the demo webserver
     """
 
-    def setUp(self, debug=False, profile=True):
-        server_class = NiceGuiWidgetsDemoWebserver
-        cmd_class = NiceguiWidgetsCmd
-        WebserverTest.setUp(self, server_class, cmd_class, debug=debug, profile=profile)
+    # one demo webserver is shared by all tests of this class
+    server_class = NiceGuiWidgetsDemoWebserver
+    cmd_class = NiceguiWidgetsCmd
+
+    def setUp(self, debug=False, profile=None):
+        WebserverTest.setUp(self, debug=debug, profile=profile)
 
     def testDemoWebserver(self):
         """
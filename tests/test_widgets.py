@@ -7,6 +7,9 @@ Created on 2023-09-10
 from ngwidgets.basetest import Basetest
 from ngwidgets.widgets import Link
 
+# the link is created once at module level
+LINK_HTML = Link.create("http://nicegui.io", "nicegui", "nicegui")
+
 
 class TestNiceGuiWidgets(Basetest):
     """
@@ -17,10 +20,9 @@ class TestNiceGuiWidgets(Basetest):
         """
         test the Link create method
         """
-        link_html = Link.create("http://nicegui.io", "nicegui", "nicegui")
         debug = self.debug
         # debug=True
         if debug:
-            print(link_html)
+            print(LINK_HTML)
         expected = "<a href='http://nicegui.io' title='nicegui' style='color: blue;text-decoration: underline;'>nicegui</a>"
-        self.assertTrue(expected, link_html)
+        self.assertEqual(expected, LINK_HTML)
@@ -4,7 +4,9 @@ Created on 2024-06-22
 @author: wf
 """
 
-import json
+from unittest.mock import Mock, patch
+
+import orjson
 
 from ngwidgets.basetest import Basetest
 from ngwidgets.wikipedia import WikipediaSearch
@@ -15,9 +17,62 @@ class TestWikipediaSearch(Basetest):
     test Wikipedia Search
     """
 
-    def setUp(self, debug=False, profile=True):
+    # canned search results of the Wikipedia API to be replayed
+    search_results = [
+        {
+            "pageid": 27010,
+            "title": "Software engineering",
+            "snippet": '<span class="searchmatch">Software</span> <span class="searchmatch">engineering</span> is an engineering approach to software development.',
+        },
+        {
+            "pageid": 1037226,
+            "title": "Software engineer",
+            "snippet": 'A <span class="searchmatch">software</span> <span class="searchmatch">engineer</span> is a person who applies the engineering design process to develop software.',
+        },
+        {
+            "pageid": 1389244,
+            "title": "History of software engineering",
+            "snippet": 'The history of <span class="searchmatch">software</span> <span class="searchmatch">engineering</span> begins around the 1960s.',
+        },
+    ]
+
+    def setUp(self, debug=False, profile=None):
         Basetest.setUp(self, debug=debug, profile=profile)
         self.wikipedia_search = WikipediaSearch()
+        # replay the canned responses instead of accessing the Wikipedia API
+        patcher = patch.object(
+            self.wikipedia_search.session, "get", side_effect=self.replay_get
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def replay_get(self, url: str, params: dict = None) -> Mock:
+        """
+        get a canned response for the given Wikipedia API request
+        """
+        if params.get("list") == "search":
+            data = {"query": {"search": self.search_results}}
+        else:
+            page_id = params["pageids"]
+            title = next(
+                result["title"]
+                for result in self.search_results
+                if str(result["pageid"]) == page_id
+            )
+            fullurl = f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+            data = {
+                "query": {
+                    "pages": {
+                        page_id: {
+                            "pageid": int(page_id),
+                            "title": title,
+                            "fullurl": fullurl,
+                        }
+                    }
+                }
+            }
+        response = Mock(content=orjson.dumps(data))
+        return response
 
     def test_wikipedia_search(self):
         """
@@ -32,10 +87,12 @@ class TestWikipediaSearch(Basetest):
 
         # Debug print if needed
         if self.debug:
-            print(f"Search results for '{query}': \n{json.dumps(results, indent=2)}")
+            results_json = orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+            print(f"Search results for '{query}': \n{results_json}")
 
         # Check if the expected title is in the results
-        found = any(expected_title in result["title"] for result in results)
+        titles = {result["title"] for result in results}
+        found = expected_title in titles
         self.assertTrue(
             found, f"Expected to find '{expected_title}' in the search results."
         )
@@ -0,0 +1,170 @@
+"""
+Created on 2026-10-16
+
+@author: wf
+"""
+
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Tuple
+
+import yaml
+
+from ngwidgets.basetest import Basetest
+from ngwidgets.yamlable import YamlAble, lod_storable
+
+
+@lod_storable
+class MockYamlAble:
+    """
+    a mock dataclass to test the YAML serialization
+    """
+
+    name: str
+    text: Optional[str] = None
+    comment: Optional[str] = None
+    tags: Tuple[str, ...] = ()
+    path: Optional[Path] = None
+
+
+class ETagRequestHandler(BaseHTTPRequestHandler):
+    """
+    serve the content of the server with its ETag and answer
+    conditional requests for an unchanged content with 304 Not Modified
+    """
+
+    def do_GET(self):
+        if_none_match = self.headers.get("If-None-Match")
+        self.server.if_none_matches.append(if_none_match)
+        if self.server.etag and if_none_match == self.server.etag:
+            self.send_response(304)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            if self.server.etag:
+                self.send_header("ETag", self.server.etag)
+            self.send_header("Content-Length", str(len(self.server.content)))
+            self.end_headers()
+            self.wfile.write(self.server.content)
+
+    def log_message(self, format, *args):
+        """
+        do not log the requests
+        """
+
+
+class TestYamlAble(Basetest):
+    """
+    test YamlAble
+    """
+
+    def test_to_yaml(self):
+        """
+        test that None values are omitted, multi line strings use
+        the block scalar style and the global yaml dumper is not modified
+        """
+        mock = MockYamlAble(name="mock", text="line 1\nline 2", tags=("a", "b"))
+        yaml_str = mock.to_yaml()
+        if self.debug:
+            print(yaml_str)
+        expected = """name: mock
+text: |-
+  line 1
+  line 2
+tags:
+- a
+- b
+"""
+        self.assertEqual(expected, yaml_str)
+        # the global dumpers still use their default representers
+        for dumper in yaml.Dumper, yaml.SafeDumper:
+            self.assertEqual(
+                "a: null\nb: 'x\n\n  y'\n",
+                yaml.dump({"a": None, "b": "x\ny"}, Dumper=dumper),
+            )
+
+    def test_to_yaml_fallback(self):
+        """
+        test that values the safe dumper can not represent are still dumped
+        """
+        mock = MockYamlAble(name="mock", path=Path("/tmp/mock.yaml"))
+        yaml_str = mock.to_yaml()
+        if self.debug:
+            print(yaml_str)
+        self.assertIn("name: mock", yaml_str)
+        self.assertIn("!!python/object/apply:pathlib", yaml_str)
+
+
+class TestYamlAbleUrlCache(Basetest):
+    """
+    test the ETag based url cache of YamlAble
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        start a local http server serving the test content
+        """
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ETagRequestHandler)
+        thread = threading.Thread(
+            target=cls.server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        thread.start()
+        host, port = cls.server.server_address
+        cls.url = f"http://{host}:{port}/test.yaml"
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        stop the local http server
+        """
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self, debug=False, profile=None):
+        Basetest.setUp(self, debug=debug, profile=profile)
+        self.server.content = b"name: test\n"
+        self.server.etag = '"v1"'
+        self.server.if_none_matches = []
+        self.cache_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_directory.cleanup)
+
+    def read(self) -> str:
+        """
+        read my url via the ETag based cache
+        """
+        content = YamlAble.read_from_url(
+            self.url, cache_directory=self.cache_directory.name
+        )
+        return content
+
+    def test_read_from_url_cached(self):
+        """
+        test that an unchanged content is served from the cache
+        after a 304 Not Modified response and a changed content is downloaded again
+        """
+        for _ in range(2):
+            self.assertEqual("name: test\n", self.read())
+        self.server.content = b"name: changed\n"
+        self.server.etag = '"v2"'
+        self.assertEqual("name: changed\n", self.read())
+        self.assertEqual("name: changed\n", self.read())
+        if self.debug:
+            print(self.server.if_none_matches)
+        self.assertEqual([None, '"v1"', '"v1"', '"v2"'], self.server.if_none_matches)
+
+    def test_read_from_url_without_etag(self):
+        """
+        test that a content without ETag is not cached
+        """
+        self.server.etag = None
+        for _ in range(2):
+            self.assertEqual("name: test\n", self.read())
+        self.assertEqual([None, None], self.server.if_none_matches)
+        self.assertEqual([], list(Path(self.cache_directory.name).iterdir()))